@@ -4,13 +4,15 @@
 #           Wilson Rocha Lacerda Junior <wilsonrljr@outlook.com>
 # License: BSD 3 clause
 
+import math
 import warnings
 from abc import ABCMeta, abstractmethod
 from typing import Union, Tuple, Optional
 
 import numpy as np
+from scipy.linalg import solve_triangular
 
-from sysidentpy.narmax_base import house, rowhouse
+from sysidentpy.narmax_base import house, rowhouse_inplace
 from sysidentpy.utils.information_matrix import build_lagged_matrix
 from sysidentpy.utils.check_arrays import check_positive_int, num_features
 
@@ -57,6 +59,17 @@ Estimators = Union[
 ]
 
 
+def _log(value: float) -> float:
+    """Return the natural logarithm of `value`, or -inf when it is zero.
+
+    Matches `np.log` for the variance of the residues, which is zero when the
+    model fits the data exactly.
+    """
+    if value <= 0:
+        return -math.inf
+    return math.log(value)
+
+
 def fpe(n_theta: int, n_samples: int, e_var: float) -> float:
     """Compute the Final Error Prediction value.
 
@@ -76,8 +89,8 @@ def fpe(n_theta: int, n_samples: int, e_var: float) -> float:
         user.
 
     """
-    model_factor = n_samples * np.log((n_samples + n_theta) / (n_samples - n_theta))
-    e_factor = n_samples * np.log(e_var)
+    model_factor = n_samples * math.log1p(2 * n_theta / (n_samples - n_theta))
+    e_factor = n_samples * _log(e_var)
     info_criteria_value = e_factor + model_factor
 
     return info_criteria_value
@@ -102,8 +115,8 @@ def lilc(n_theta: int, n_samples: int, e_var: float) -> float:
         user.
 
     """
-    model_factor = 2 * n_theta * np.log(np.log(n_samples))
-    e_factor = n_samples * np.log(e_var)
+    model_factor = 2 * n_theta * math.log(math.log(n_samples))
+    e_factor = n_samples * _log(e_var)
     info_criteria_value = e_factor + model_factor
 
     return info_criteria_value
@@ -130,8 +143,8 @@ def get_min_info_value(info_values):
     structure.
     - The function uses `np.diff` to compute the difference between consecutive
     elements in the sequence.
-    - The function checks if any differences are positive, indicating an increase
-    in value.
+    - The function uses `np.argmax` to find the first positive difference,
+    indicating an increase in value.
 
     Examples
     --------
@@ -148,8 +161,10 @@ def get_min_info_value(info_values):
     3
     """
     is_monotonique = np.diff(info_values) > 0
-    if any(is_monotonique):
-        return np.where(is_monotonique)[0][0] + 1
+    if is_monotonique.size:
+        first_increase = int(np.argmax(is_monotonique))
+        if is_monotonique[first_increase]:
+            return first_increase + 1
     return len(info_values)
 
 
@@ -173,7 +188,7 @@ def aic(n_theta: int, n_samples: int, e_var: float) -> float:
 
     """
     model_factor = 2 * n_theta
-    e_factor = n_samples * np.log(e_var)
+    e_factor = n_samples * _log(e_var)
     info_criteria_value = e_factor + model_factor
 
     return info_criteria_value
@@ -226,23 +241,35 @@ def bic(n_theta: int, n_samples: int, e_var: float) -> float:
         user.
 
     """
-    model_factor = n_theta * np.log(n_samples)
-    e_factor = n_samples * np.log(e_var)
+    model_factor = n_theta * math.log(n_samples)
+    e_factor = n_samples * _log(e_var)
     info_criteria_value = e_factor + model_factor
 
     return info_criteria_value
 
 
+def _swap_columns(matrix: np.ndarray, i: int, j: int) -> None:
+    """Swap the columns `i` and `j` of `matrix` in place."""
+    if i != j:
+        tmp = matrix[:, i].copy()
+        matrix[:, i] = matrix[:, j]
+        matrix[:, j] = tmp
+
+
+_FLOAT_EPS = np.finfo(np.float64).eps
+
+INFO_CRITERIA_OPTIONS = {
+    "aic": aic,
+    "aicc": aicc,
+    "bic": bic,
+    "fpe": fpe,
+    "lilc": lilc,
+}
+
+
 def get_info_criteria(info_criteria: str):
     """Get info criteria."""
-    info_criteria_options = {
-        "aic": aic,
-        "aicc": aicc,
-        "bic": bic,
-        "fpe": fpe,
-        "lilc": lilc,
-    }
-    return info_criteria_options.get(info_criteria)
+    return INFO_CRITERIA_OPTIONS.get(info_criteria)
 
 
 class OFRBase(BaseMSS, metaclass=ABCMeta):
@@ -271,7 +298,6 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
         self.xlag = xlag
         self.max_lag = self._get_max_lag()
         self.info_criteria = info_criteria
-        self.info_criteria_function = get_info_criteria(info_criteria)
         self.n_info_values = n_info_values
         self.n_terms = n_terms
         self.estimator = estimator
@@ -286,14 +312,22 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
 
         self.err_tol = err_tol
         self._validate_params()
+        self.info_criteria_function = get_info_criteria(info_criteria)
         self.n_inputs = None
         self.regressor_code = None
         self.info_values = None
+        self.rss_path = None
+        self.info_n_samples = None
         self.err = None
         self.final_model = None
         self.theta = None
         self.pivv = None
 
+    @property
+    def _is_poly(self) -> bool:
+        """Whether the model uses the Polynomial basis function."""
+        return isinstance(self.basis_function, Polynomial)
+
     def _validate_params(self):
         """Validate input params."""
         if not isinstance(self.n_info_values, int) or self.n_info_values < 1:
@@ -343,7 +377,11 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
         return self.error_reduction_ratio(psi, y, process_term_number)
 
     def error_reduction_ratio(
-        self, psi: np.ndarray, y: np.ndarray, process_term_number: int
+        self,
+        psi: np.ndarray,
+        y: np.ndarray,
+        process_term_number: int,
+        y_trim: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Perform the Error Reduction Ration algorithm.
 
@@ -355,6 +393,9 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
             The information matrix of the model.
         process_term_number : int
             Number of Process Terms defined by the user.
+        y_trim : array-like of shape = (n_samples - max_lag, 1), default=None
+            Target values without the initial conditions. Computed from `y`
+            when not given.
 
         Returns
         -------
@@ -376,34 +417,113 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
            e Novos Resultados
 
         """
-        squared_y = np.dot(y[self.max_lag :].T, y[self.max_lag :])
-        tmp_psi = psi.copy()
-        y = y[self.max_lag :, 0].reshape(-1, 1)
-        tmp_y = y.copy()
+        if y_trim is None:
+            y_trim = y[self.max_lag :, 0].reshape(-1, 1)
+
+        return self._ofr_mgs(psi, y_trim, process_term_number)
+
+    def _ofr_mgs(
+        self, psi: np.ndarray, y_trim: np.ndarray, process_term_number: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Perform the ERR algorithm using Modified Gram-Schmidt.
+
+        At each step only the remaining candidates are deflated against the
+        selected regressor, instead of reflecting the whole trailing submatrix.
+        If the selected regressor is numerically dependent on the ones already
+        chosen, the Householder implementation is used instead.
+
+        `y_trim` is the target without the initial conditions, of shape
+        (n_samples - max_lag, 1). See `error_reduction_ratio` for the
+        description of the other parameters and of the returned values.
+
+        """
+        squared_y = float(y_trim[:, 0] @ y_trim[:, 0])
+        # Fortran order makes each candidate column contiguous in memory
+        tmp_psi = psi.copy(order="F")
+        tmp_y = y_trim.copy()
         dimension = tmp_psi.shape[1]
         piv = np.arange(dimension)
         tmp_err = np.zeros(dimension)
         err = np.zeros(dimension)
+        squared_norms = np.einsum("ij,ij->j", psi, psi)
+        # Squared norms of the deflated candidates and their inner products with
+        # the deflated target. Both are downdated after each step, so the ERR of
+        # the candidates is obtained without another pass over tmp_psi.
+        col_sq = squared_norms.copy()
+        col_y = (tmp_psi.T @ tmp_y)[:, 0]
+
+        for i in range(dimension):
+            # See `_ofr_householder` for the role of alpha and eps in the ERR.
+            # Candidates already spanned by the selected regressors have no
+            # norm left and cannot reduce the error.
+            exhausted = col_sq[i:] <= _FLOAT_EPS * squared_norms[piv[i:]]
+            den = np.where(exhausted, 1.0, col_sq[i:] + self.alpha) * squared_y
+            tmp_err[i:] = np.where(exhausted, 0.0, col_y[i:] ** 2 / den + self.eps)
 
-        for i in np.arange(0, dimension):
-            for j in np.arange(i, dimension):
-                # Add `eps` in the denominator to omit division by zero if
-                # denominator is zero
-                # To implement regularized regression (ridge regression), add
-                # alpha to psi.T @ psi.   See S. Chen, Local regularization assisted
-                # orthogonal least squares regression, Neurocomputing 69 (2006) 559-585.
-                # The version implemented below uses the same regularization for every
-                # feature, # What Chen refers to Uniform regularized orthogonal least
-                # squares (UROLS) Set to tiny (self.eps) when you are not regularizing.
-                # alpha = eps is the default.
-                tmp_err[j] = (
-                    (np.dot(tmp_psi[i:, j].T, tmp_y[i:]) ** 2)
-                    / (
-                        (np.dot(tmp_psi[i:, j].T, tmp_psi[i:, j]) + self.alpha)
-                        * squared_y
-                    )
-                    + self.eps
-                )[0, 0]
+            piv_index = np.argmax(tmp_err[i:]) + i
+            err[i] = tmp_err[piv_index]
+            if i == process_term_number:
+                break
+
+            if (self.err_tol is not None) and (err.cumsum()[i] >= self.err_tol):
+                self.n_terms = i + 1
+                process_term_number = i + 1
+                break
+
+            _swap_columns(tmp_psi, i, piv_index)
+            piv[i], piv[piv_index] = piv[piv_index], piv[i]
+            col_sq[i], col_sq[piv_index] = col_sq[piv_index], col_sq[i]
+            col_y[i], col_y[piv_index] = col_y[piv_index], col_y[i]
+            q = tmp_psi[:, i]
+            norm = np.linalg.norm(q)
+            if norm**2 <= _FLOAT_EPS * squared_norms[piv[i]]:
+                return self._ofr_householder(psi, y_trim, process_term_number)
+
+            q /= norm
+            coefs = q @ tmp_psi[:, i + 1 :]
+            q_y = q @ tmp_y[:, 0]
+            tmp_psi[:, i + 1 :] -= np.outer(q, coefs)
+            tmp_y[:, 0] -= q_y * q
+            col_sq[i + 1 :] = np.maximum(col_sq[i + 1 :] - coefs**2, 0.0)
+            col_y[i + 1 :] -= coefs * q_y
+
+        tmp_piv = piv[0:process_term_number]
+        psi_orthogonal = psi[:, tmp_piv]
+        return err, tmp_piv, psi_orthogonal
+
+    def _ofr_householder(
+        self, psi: np.ndarray, y_trim: np.ndarray, process_term_number: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Perform the ERR algorithm using Householder reflections.
+
+        `y_trim` is the target without the initial conditions, of shape
+        (n_samples - max_lag, 1). See `error_reduction_ratio` for the
+        description of the other parameters and of the returned values.
+
+        """
+        squared_y = float(y_trim[:, 0] @ y_trim[:, 0])
+        # Fortran order makes each candidate column contiguous in memory
+        tmp_psi = psi.copy(order="F")
+        tmp_y = y_trim.copy()
+        dimension = tmp_psi.shape[1]
+        piv = np.arange(dimension)
+        tmp_err = np.zeros(dimension)
+        err = np.zeros(dimension)
+
+        for i in range(dimension):
+            # Add `eps` in the denominator to omit division by zero if
+            # denominator is zero
+            # To implement regularized regression (ridge regression), add
+            # alpha to psi.T @ psi.   See S. Chen, Local regularization assisted
+            # orthogonal least squares regression, Neurocomputing 69 (2006) 559-585.
+            # The version implemented below uses the same regularization for every
+            # feature, # What Chen refers to Uniform regularized orthogonal least
+            # squares (UROLS) Set to tiny (self.eps) when you are not regularizing.
+            # alpha = eps is the default.
+            candidates = tmp_psi[i:, i:]
+            num = candidates.T @ tmp_y[i:]
+            den = np.einsum("ij,ij->j", candidates, candidates)
+            tmp_err[i:] = (num[:, 0] ** 2) / ((den + self.alpha) * squared_y) + self.eps
 
             piv_index = np.argmax(tmp_err[i:]) + i
             err[i] = tmp_err[piv_index]
@@ -415,18 +535,19 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
                 process_term_number = i + 1
                 break
 
-            tmp_psi[:, [piv_index, i]] = tmp_psi[:, [i, piv_index]]
-            piv[[piv_index, i]] = piv[[i, piv_index]]
+            _swap_columns(tmp_psi, i, piv_index)
+            piv[i], piv[piv_index] = piv[piv_index], piv[i]
             v = house(tmp_psi[i:, i])
-            row_result = rowhouse(tmp_psi[i:, i:], v)
-            tmp_y[i:] = rowhouse(tmp_y[i:], v)
-            tmp_psi[i:, i:] = np.copy(row_result)
+            rowhouse_inplace(tmp_psi[i:, i:], v)
+            rowhouse_inplace(tmp_y[i:], v)
 
         tmp_piv = piv[0:process_term_number]
         psi_orthogonal = psi[:, tmp_piv]
         return err, tmp_piv, psi_orthogonal
 
-    def information_criterion(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    def information_criterion(
+        self, x: np.ndarray, y: np.ndarray, y_trim: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Determine the model order.
 
         This function uses a information criterion to determine the model size.
@@ -442,13 +563,17 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
             Target values of the system.
         x : array-like of shape = n_samples
             Input system values measured by the user.
+        y_trim : array-like of shape = (n_samples - max_lag, 1), default=None
+            Target values without the initial conditions. Computed from `y`
+            when not given.
 
         Returns
         -------
         output_vector : array-like of shape = n_regressor
             Vector with values of akaike's information criterion
             for models with N terms (where N is the
-            vector position + 1).
+            vector position + 1). The search stops once the criterion
+            increases twice in a row, leaving the remaining values as NaN.
 
         """
         if self.n_info_values is not None and self.n_info_values > x.shape[1]:
@@ -463,23 +588,175 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
         output_vector = np.zeros(self.n_info_values)
         output_vector[:] = np.nan
 
-        n_samples = len(y) - self.max_lag
+        if y_trim is None:
+            y_trim = y[self.max_lag :, 0].reshape(-1, 1)
 
-        for i in range(self.n_info_values):
-            n_theta = i + 1
-            regressor_matrix = self.run_mss_algorithm(x, y, n_theta)[2]
+        n_samples = y_trim.shape[0]
+        self.info_n_samples = n_samples
+        self.rss_path = np.full(self.n_info_values, np.nan)
 
-            tmp_theta = self.estimator.optimize(
-                regressor_matrix, y[self.max_lag :, 0].reshape(-1, 1)
-            )
+        # The regressors are selected greedily, so the model with N terms is
+        # the N-term prefix of the model with n_info_values terms.
+        psi_full = self.run_mss_algorithm(x, y, self.n_info_values)[2]
+
+        info_criteria_function = self.info_criteria_function
+        n_increases = 0
+        for i, rss in enumerate(self._rss_values(psi_full, y_trim)):
+            self.rss_path[i] = rss
+            e_var = rss / (n_samples - 1)
+            output_vector[i] = info_criteria_function(i + 1, n_samples, e_var)
 
-            tmp_yhat = np.dot(regressor_matrix, tmp_theta)
-            tmp_residual = y[self.max_lag :] - tmp_yhat
-            e_var = np.var(tmp_residual, ddof=1)
-            output_vector[i] = self.info_criteria_function(n_theta, n_samples, e_var)
+            # `get_min_info_value` only uses the values up to the first increase,
+            # so larger models are not evaluated once the criterion keeps rising.
+            if i > 0 and output_vector[i] > output_vector[i - 1]:
+                n_increases += 1
+            else:
+                n_increases = 0
+
+            if n_increases >= 2:
+                break
 
         return output_vector
 
+    def compute_info_values(self, info_criteria: str) -> np.ndarray:
+        """Compute the information criteria values of the last order selection.
+
+        The residual sum of squares of each model size evaluated by
+        `information_criterion` is stored in `rss_path`, so any information
+        criteria can be obtained from it without running the MSS algorithm or
+        refitting the models again.
+
+        `information_criterion` stops once the criterion chosen at fit time
+        increases twice in a row, so `rss_path` ends at that model size. The
+        values of any other criterion past that point are NaN, even if that
+        criterion would have kept decreasing.
+
+        Parameters
+        ----------
+        info_criteria : str
+            The information criteria to compute: "aic", "aicc", "bic", "fpe"
+            or "lilc".
+
+        Returns
+        -------
+        info_values : array-like of shape = n_info_values
+            Vector with the values of the information criteria for models
+            with N terms (where N is the vector position + 1). Model sizes
+            not evaluated by `information_criterion` are NaN.
+
+        """
+        if info_criteria not in INFO_CRITERIA_OPTIONS:
+            raise ValueError(
+                "info_criteria must be aic, aicc, bic, fpe or lilc."
+                f" Got {info_criteria}"
+            )
+
+        if self.rss_path is None:
+            raise ValueError(
+                "The model order selection was not run. Fit the model with"
+                " order_selection=True first."
+            )
+
+        info_criteria_function = get_info_criteria(info_criteria)
+        e_var = self.rss_path / (self.info_n_samples - 1)
+        return np.array(
+            [
+                info_criteria_function(n_theta, self.info_n_samples, value)
+                for n_theta, value in enumerate(e_var, start=1)
+            ]
+        )
+
+    def _rss_values(self, psi: np.ndarray, y_trim: np.ndarray):
+        """Yield the residual sum of squares of each model size in order.
+
+        Plain least squares models are obtained from a single orthogonalization
+        of `psi`. Otherwise, each model size is fitted with the estimator. The
+        values are yielded lazily, so the caller can stop consuming them
+        without evaluating every model size.
+
+        Parameters
+        ----------
+        psi : ndarray of floats
+            The regressors selected by the MSS algorithm, in selection order.
+        y_trim : array-like of shape = (n_samples, 1)
+            Target values of the system without the initial conditions.
+
+        """
+        if type(self.estimator) is LeastSquares:
+            yield from self._least_squares_rss_values(psi, y_trim)
+            return
+
+        for n_theta in range(1, self.n_info_values + 1):
+            yield self._order_rss(psi, y_trim, n_theta)
+
+    def _least_squares_rss_values(self, psi: np.ndarray, y_trim: np.ndarray):
+        """Yield the least squares residual sum of squares incrementally.
+
+        The residual of the least squares model with the first n_theta
+        regressors is the target minus its projection on an orthonormal basis
+        of those regressors. The basis is built one regressor at a time
+        (Gram-Schmidt with reorthogonalization), so each model size removes one
+        more projection from the residual instead of solving a new least
+        squares problem.
+
+        Parameters
+        ----------
+        psi : ndarray of floats
+            The regressors selected by the MSS algorithm, in selection order.
+        y_trim : array-like of shape = (n_samples, 1)
+            Target values of the system without the initial conditions.
+
+        """
+        n_samples, n_columns = psi.shape
+        tol = max(psi.shape) * _FLOAT_EPS
+        q = np.empty((n_samples, n_columns))
+        rank = 0
+        tmp_residual = y_trim[:, 0].copy()
+        for n_theta in range(1, self.n_info_values + 1):
+            if n_theta <= n_columns:
+                regressor = psi[:, n_theta - 1].copy()
+                for _ in range(2):
+                    regressor -= q[:, :rank] @ (q[:, :rank].T @ regressor)
+
+                norm = np.linalg.norm(regressor)
+                # A regressor linearly dependent on the previous ones does not
+                # change the least squares fit.
+                if norm > tol * np.linalg.norm(psi[:, n_theta - 1]):
+                    q[:, rank] = regressor / norm
+                    tmp_residual -= (q[:, rank] @ tmp_residual) * q[:, rank]
+                    rank += 1
+
+            centered_residual = tmp_residual - tmp_residual.mean()
+            yield float(centered_residual @ centered_residual)
+
+    def _order_rss(self, psi: np.ndarray, y_trim: np.ndarray, n_theta: int) -> float:
+        """Compute the residual sum of squares of the model with n_theta terms.
+
+        The residues are centered, so `rss / (n_samples - 1)` is their unbiased
+        variance.
+
+        Parameters
+        ----------
+        psi : ndarray of floats
+            The regressors selected by the MSS algorithm, in selection order.
+        y_trim : array-like of shape = (n_samples, 1)
+            Target values of the system without the initial conditions.
+        n_theta : int
+            Number of terms of the model.
+
+        Returns
+        -------
+        rss : float
+            The residual sum of squares of the centered residues.
+
+        """
+        regressor_matrix = psi[:, :n_theta]
+        tmp_theta = self.estimator.optimize(regressor_matrix, y_trim)
+
+        tmp_residual = y_trim - regressor_matrix @ tmp_theta
+        tmp_residual -= tmp_residual.mean()
+        return (tmp_residual.T @ tmp_residual).item()
+
     def fit(self, *, X: Optional[np.ndarray] = None, y: np.ndarray):
         """Fit polynomial NARMAX model.
 
@@ -515,6 +792,7 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
             raise ValueError("y cannot be None")
 
         self.max_lag = self._get_max_lag()
+        y_trim = np.ascontiguousarray(y[self.max_lag :, 0]).reshape(-1, 1)
         lagged_data = build_lagged_matrix(X, y, self.xlag, self.ylag, self.model_type)
 
         reg_matrix = self.basis_function.fit(
@@ -534,7 +812,7 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
         self.regressor_code = self.regressor_space(self.n_inputs)
 
         if self.order_selection is True:
-            self.info_values = self.information_criterion(reg_matrix, y)
+            self.info_values = self.information_criterion(reg_matrix, y, y_trim)
 
         if self.n_terms is None and self.order_selection is True:
             model_length = get_min_info_value(self.info_values)
@@ -550,20 +828,24 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
 
         tmp_piv = self.pivv[0:model_length]
         repetition = len(reg_matrix)
-        if isinstance(self.basis_function, Polynomial):
+        if self._is_poly:
             self.final_model = self.regressor_code[tmp_piv, :].copy()
         else:
-            self.regressor_code = np.sort(
-                np.tile(self.regressor_code[1:, :], (repetition, 1)),
-                axis=0,
-            )
-            self.final_model = self.regressor_code[tmp_piv, :].copy()
+            # Row p of np.sort(np.tile(code[1:], (repetition, 1)), axis=0) is row
+            # p // repetition of the column-wise sorted code, so only the
+            # selected rows are built instead of the whole repeated code.
+            sorted_code = np.sort(self.regressor_code[1:, :], axis=0)
+            self.final_model = sorted_code[tmp_piv // repetition, :]
+
+        if type(self.estimator) is LeastSquares and not self.estimator.unbiased:
+            self.theta = self._least_squares_theta(psi, y_trim)
+        else:
+            self.theta = self.estimator.optimize(psi, y_trim)
 
-        self.theta = self.estimator.optimize(psi, y[self.max_lag :, 0].reshape(-1, 1))
         if self.estimator.unbiased is True:
             self.theta = self.estimator.unbiased_estimator(
                 psi,
-                y[self.max_lag :, 0].reshape(-1, 1),
+                y_trim,
                 self.theta,
                 self.elag,
                 self.max_lag,
@@ -573,6 +855,35 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
             )
         return self
 
+    def _least_squares_theta(self, psi: np.ndarray, y_trim: np.ndarray) -> np.ndarray:
+        """Estimate the least squares parameters from a QR factorization of psi.
+
+        `LeastSquares.optimize` computes the rank of `psi` and then solves the
+        problem with `np.linalg.lstsq`, both SVD based. A single QR
+        factorization gives the rank check through the diagonal of R and the
+        solution through a triangular solve. Rank deficient matrices are left
+        to the estimator, which warns and returns the minimum norm solution.
+
+        Parameters
+        ----------
+        psi : ndarray of floats
+            The information matrix of the model.
+        y_trim : array-like of shape = (n_samples, 1)
+            Target values of the system without the initial conditions.
+
+        Returns
+        -------
+        theta : array-like of shape = (n_regressors, 1)
+            The estimated parameters of the model.
+
+        """
+        q, r = np.linalg.qr(psi)
+        diag = np.abs(np.diag(r))
+        if diag.size == 0 or diag.min() <= diag.max() * max(psi.shape) * _FLOAT_EPS:
+            return self.estimator.optimize(psi, y_trim)
+
+        return solve_triangular(r, q.T @ y_trim)
+
     def predict(
         self,
         *,
@@ -608,7 +919,7 @@ class OFRBase(BaseMSS, metaclass=ABCMeta):
             The predicted values of the model.
 
         """
-        if isinstance(self.basis_function, Polynomial):
+        if self._is_poly:
             if steps_ahead is None:
                 yhat = self._model_prediction(X, y, forecast_horizon=forecast_horizon)
                 yhat = np.concatenate([y[: self.max_lag], yhat], axis=0)
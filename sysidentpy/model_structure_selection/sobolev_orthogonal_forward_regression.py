@@ -8,10 +8,10 @@ from typing import Union, Tuple, Optional
 
 import numpy as np
 
-from sysidentpy.narmax_base import house, rowhouse
+from sysidentpy.narmax_base import house, rowhouse_inplace
 
 from ..basis_function import Fourier, Polynomial
-from .ofr_base import OFRBase, get_info_criteria
+from .ofr_base import OFRBase, get_info_criteria, _swap_columns
 
 from ..parameter_estimation.estimators import (
     LeastSquares,
@@ -175,7 +175,6 @@ class UOFR(OFRBase):
         self.xlag = xlag
         self.max_lag = self._get_max_lag()
         self.info_criteria = info_criteria
-        self.info_criteria_function = get_info_criteria(info_criteria)
         self.n_info_values = n_info_values
         self.n_terms = n_terms
         self.estimator = estimator
@@ -190,9 +189,12 @@ class UOFR(OFRBase):
 
         self.err_tol = err_tol
         self._validate_params()
+        self.info_criteria_function = get_info_criteria(info_criteria)
         self.n_inputs = None
         self.regressor_code = None
         self.info_values = None
+        self.rss_path = None
+        self.info_n_samples = None
         self.err = None
         self.final_model = None
         self.theta = None
@@ -257,33 +259,31 @@ class UOFR(OFRBase):
         y_augmented, psi_augmented = self.augment_uls_terms(y, psi, m, test_support)
         y_augmented = y_augmented.reshape(-1, 1)
         # Compute ERR on the augmented ULS matrix
-        squared_y = np.dot(y_augmented.T, y_augmented)
-        psi_working = psi_augmented.copy()
+        squared_y = float(y_augmented[:, 0] @ y_augmented[:, 0])
+        # Fortran order makes each candidate column contiguous in memory
+        psi_working = psi_augmented.copy(order="F")
         y_working = y_augmented.copy()
+        # 1-D view of the working target, so each dot product is a scalar
+        y_column = y_working[:, 0]
         num_terms = psi_working.shape[1]
         piv = np.arange(num_terms)
         candidate_err = np.zeros(num_terms)
         err = np.zeros(num_terms)
 
-        for step_idx in np.arange(0, num_terms):
-            for term_idx in np.arange(step_idx, num_terms):
+        for step_idx in range(num_terms):
+            for term_idx in range(step_idx, num_terms):
                 candidate_err[term_idx] = (
+                    np.dot(psi_working[step_idx:, term_idx], y_column[step_idx:]) ** 2
+                ) / (
                     (
-                        np.dot(psi_working[step_idx:, term_idx].T, y_working[step_idx:])
-                        ** 2
-                    )
-                    / (
-                        (
-                            np.dot(
-                                psi_working[step_idx:, term_idx].T,
-                                psi_working[step_idx:, term_idx],
-                            )
-                            + self.alpha
+                        np.dot(
+                            psi_working[step_idx:, term_idx],
+                            psi_working[step_idx:, term_idx],
                         )
-                        * squared_y
+                        + self.alpha
                     )
-                    + self.eps
-                )[0, 0]
+                    * squared_y
+                ) + self.eps
 
             max_err_idx = np.argmax(candidate_err[step_idx:]) + step_idx
             err[step_idx] = candidate_err[max_err_idx]
@@ -295,14 +295,11 @@ class UOFR(OFRBase):
                 process_term_number = step_idx + 1
                 break
 
-            psi_working[:, [max_err_idx, step_idx]] = psi_working[
-                :, [step_idx, max_err_idx]
-            ]
-            piv[[max_err_idx, step_idx]] = piv[[step_idx, max_err_idx]]
+            _swap_columns(psi_working, step_idx, max_err_idx)
+            piv[step_idx], piv[max_err_idx] = piv[max_err_idx], piv[step_idx]
             reflector = house(psi_working[step_idx:, step_idx])
-            row_result = rowhouse(psi_working[step_idx:, step_idx:], reflector)
-            y_working[step_idx:] = rowhouse(y_working[step_idx:], reflector)
-            psi_working[step_idx:, step_idx:] = np.copy(row_result)
+            rowhouse_inplace(psi_working[step_idx:, step_idx:], reflector)
+            rowhouse_inplace(y_working[step_idx:], reflector)
 
         tmp_piv = piv[0:process_term_number]
         psi_orthogonal = psi[:, tmp_piv]
@@ -3,12 +3,18 @@ from typing import Tuple
 import pytest
 import numpy as np
 
+from sysidentpy.model_structure_selection import ofr_base
 from sysidentpy.model_structure_selection.ofr_base import (
     OFRBase,
+    aic,
+    get_min_info_value,
 )
-from sysidentpy.parameter_estimation import RecursiveLeastSquares
-from sysidentpy.basis_function import Polynomial
+from sysidentpy.narmax_base import house, rowhouse
+from sysidentpy.parameter_estimation import LeastSquares, RecursiveLeastSquares
+from sysidentpy.basis_function import Fourier, Polynomial
+from sysidentpy.model_structure_selection import FROLS
 from sysidentpy.parameter_estimation import RidgeRegression
+from sysidentpy.utils.generate_data import get_siso_data
 
 
 # Create a subclass to instantiate the abstract class
@@ -229,3 +235,273 @@ def test_error_reduction_ratio_with_small_eps(setup_data):
     assert err.shape[0] == psi.shape[1]
     assert piv.shape[0] == process_term_number
     assert psi_orthogonal.shape[1] == process_term_number
+
+
+def test_error_reduction_ratio_trimmed_target(setup_data):
+    """Test that passing the trimmed target gives the same ERR."""
+    y, psi, process_term_number = setup_data
+    model = MockOFRBase()
+
+    err, piv, psi_orthogonal = model.error_reduction_ratio(psi, y, process_term_number)
+    err_t, piv_t, psi_orthogonal_t = model.error_reduction_ratio(
+        psi, y, process_term_number, y_trim=y[2:]
+    )
+
+    np.testing.assert_array_equal(err, err_t)
+    np.testing.assert_array_equal(piv, piv_t)
+    np.testing.assert_array_equal(psi_orthogonal, psi_orthogonal_t)
+
+
+def test_ofr_mgs_matches_householder(setup_data):
+    """Test the Gram-Schmidt ERR against the Householder implementation."""
+    y, psi, process_term_number = setup_data
+    model = MockOFRBase()
+
+    err, piv, psi_orthogonal = model._ofr_mgs(psi, y[2:], process_term_number)
+    err_h, piv_h, psi_orthogonal_h = model._ofr_householder(
+        psi, y[2:], process_term_number
+    )
+
+    np.testing.assert_array_equal(piv, piv_h)
+    np.testing.assert_allclose(
+        err[:process_term_number], err_h[:process_term_number], rtol=1e-8
+    )
+    np.testing.assert_allclose(psi_orthogonal, psi_orthogonal_h)
+
+
+def test_ofr_mgs_dependent_regressor_fallback(setup_data):
+    """Test the Householder fallback when regressors are linearly dependent."""
+    y, psi, _ = setup_data
+    psi = np.hstack([psi, psi[:, :1]])
+    model = MockOFRBase()
+
+    err, piv, _ = model._ofr_mgs(psi, y[2:], psi.shape[1])
+    err_h, piv_h, _ = model._ofr_householder(psi, y[2:], psi.shape[1])
+
+    np.testing.assert_array_equal(piv, piv_h)
+    np.testing.assert_allclose(err, err_h)
+
+
+@pytest.mark.parametrize(
+    ("info_values", "expected"),
+    [
+        ([3, 2, 1, 4, 5], 3),
+        ([3, 2, 1, 0], 4),
+        ([1, 2, 3], 1),
+        ([1], 1),
+    ],
+)
+def test_get_min_info_value(info_values, expected):
+    """Test the model size selected from the information criteria values."""
+    assert get_min_info_value(np.array(info_values)) == expected
+
+
+def test_information_criterion_stops_after_increases():
+    """Test that larger models are skipped once the criterion keeps rising."""
+    rng = np.random.default_rng(42)
+    psi = rng.normal(size=(500, 10))
+    y = np.zeros((502, 1))
+    y[2:] = psi[:, :1] + 0.01 * rng.normal(size=(500, 1))
+    model = MockOFRBase()
+    model.n_info_values = 10
+    model.estimator = LeastSquares()
+    model.info_criteria_function = aic
+
+    info_values = model.information_criterion(psi, y)
+
+    n_evaluated = np.count_nonzero(~np.isnan(info_values))
+    assert n_evaluated < model.n_info_values
+    assert np.all(np.isnan(info_values[n_evaluated:]))
+    assert np.all(np.diff(info_values[n_evaluated - 3 : n_evaluated]) > 0)
+
+
+def test_information_criterion_matches_each_model_size():
+    """Test the criteria of a non least squares estimator against each size."""
+    rng = np.random.default_rng(0)
+    psi = rng.normal(size=(300, 12))
+    y = np.zeros((302, 1))
+    y[2:] = psi[:, :8] @ rng.normal(size=(8, 1)) + 0.1 * rng.normal(size=(300, 1))
+    model = MockOFRBase()
+    model.n_info_values = 12
+    model.estimator = RidgeRegression(alpha=1e-3)
+    model.info_criteria_function = aic
+
+    info_values = model.information_criterion(psi, y)
+
+    psi_full = model.error_reduction_ratio(psi, y, model.n_info_values)[2]
+    expected = [
+        aic(n, 300, model._order_rss(psi_full, y[2:], n) / 299) for n in range(1, 13)
+    ]
+    n_evaluated = np.count_nonzero(~np.isnan(info_values))
+    assert n_evaluated >= 8
+    np.testing.assert_allclose(info_values[:n_evaluated], expected[:n_evaluated])
+
+
+def test_information_criterion_least_squares_matches_optimize():
+    """Test the incremental least squares residues against refitting each size."""
+    rng = np.random.default_rng(1)
+    psi = rng.normal(size=(300, 8))
+    # a regressor linearly dependent on the previous ones
+    psi = np.hstack([psi[:, :3], psi[:, :1] + psi[:, 1:2], psi[:, 3:]])
+    y_trim = psi[:, :5] @ rng.normal(size=(5, 1)) + 0.1 * rng.normal(size=(300, 1))
+    model = MockOFRBase()
+    model.n_info_values = 9
+    model.estimator = LeastSquares()
+    model.info_criteria_function = aic
+
+    rss_values = list(model._rss_values(psi, y_trim))
+
+    expected = [model._order_rss(psi, y_trim, n) for n in range(1, 10)]
+    np.testing.assert_allclose(rss_values, expected, rtol=1e-10)
+
+
+def test_fit_fourier_final_model_matches_repeated_code():
+    """Test the Fourier final model against the sorted repeated regressor code."""
+    x_train, _, y_train, _ = get_siso_data(n=200, colored_noise=False, sigma=0.001)
+    model = FROLS(
+        n_terms=5,
+        order_selection=False,
+        ylag=2,
+        xlag=2,
+        basis_function=Fourier(degree=1),
+    )
+    model.fit(X=x_train, y=y_train)
+
+    repeated_code = np.sort(
+        np.tile(model.regressor_code[1:, :], (len(y_train) - model.max_lag, 1)),
+        axis=0,
+    )
+    np.testing.assert_array_equal(model.final_model, repeated_code[model.pivv, :])
+
+
+def test_least_squares_theta_matches_optimize(setup_data):
+    """Test the QR least squares parameters against LeastSquares.optimize."""
+    y, psi, _ = setup_data
+    y_trim = y[2:]
+    model = MockOFRBase()
+    model.estimator = LeastSquares()
+
+    np.testing.assert_allclose(
+        model._least_squares_theta(psi, y_trim),
+        LeastSquares().optimize(psi, y_trim),
+    )
+
+    psi_dependent = np.hstack([psi, psi[:, :1]])
+    with pytest.warns(UserWarning, match="linearly dependent"):
+        theta = model._least_squares_theta(psi_dependent, y_trim)
+    np.testing.assert_allclose(theta, LeastSquares().optimize(psi_dependent, y_trim))
+
+
+@pytest.mark.parametrize("info_criteria", ["aic", "aicc", "bic", "fpe", "lilc"])
+def test_compute_info_values_matches_information_criterion(info_criteria):
+    """Test the criteria computed from rss_path against information_criterion."""
+    rng = np.random.default_rng(2)
+    psi = rng.normal(size=(300, 8))
+    y = np.zeros((302, 1))
+    y[2:] = psi[:, :4] @ rng.normal(size=(4, 1)) + 0.1 * rng.normal(size=(300, 1))
+    model = MockOFRBase()
+    model.n_info_values = 8
+    model.estimator = LeastSquares()
+    model.info_criteria_function = aic
+    model.information_criterion(psi, y)
+
+    model.info_criteria_function = ofr_base.get_info_criteria(info_criteria)
+    expected = model.information_criterion(psi, y)
+
+    np.testing.assert_allclose(
+        model.compute_info_values(info_criteria)[~np.isnan(expected)],
+        expected[~np.isnan(expected)],
+    )
+
+
+def test_compute_info_values_invalid():
+    """Test compute_info_values with invalid criteria or without order selection."""
+    model = MockOFRBase()
+    model.rss_path = None
+    with pytest.raises(ValueError, match="order_selection=True"):
+        model.compute_info_values("aic")
+
+    with pytest.raises(ValueError, match="aic, aicc, bic, fpe or lilc"):
+        model.compute_info_values("AIC")
+
+
+@pytest.mark.parametrize("info_criteria", ["aic", "aicc", "bic", "fpe", "lilc"])
+def test_info_criteria_zero_variance(info_criteria):
+    """Test that a zero residual variance gives -inf instead of raising."""
+    info_criteria_function = ofr_base.get_info_criteria(info_criteria)
+    assert info_criteria_function(3, 100, 0.0) == -np.inf
+
+
+@pytest.mark.parametrize("estimator", [LeastSquares(), RidgeRegression()])
+def test_fit_exact_model_order_selection(estimator):
+    """Test the order selection when the model fits the target exactly."""
+    x_train, _, y_train, _ = get_siso_data(n=200, colored_noise=False, sigma=0.001)
+    model = FROLS(
+        order_selection=True,
+        n_info_values=6,
+        n_terms=1,
+        ylag=2,
+        xlag=2,
+        estimator=estimator,
+        basis_function=Polynomial(degree=2),
+    )
+    model.fit(X=x_train, y=np.ones_like(y_train))
+    assert np.isneginf(model.info_values[0])
+    assert model.pivv.tolist() == [0]
+    assert model.theta.shape == (1, 1)
+
+
+def test_is_poly_follows_basis_function():
+    """Test that _is_poly reflects a basis function set after construction."""
+    model = FROLS(basis_function=Polynomial(degree=2))
+    assert model._is_poly
+    model.basis_function = Fourier(degree=1)
+    assert not model._is_poly
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("n_samples", [500, 1000, 1024])
+@pytest.mark.parametrize("seed", range(5))
+def test_error_reduction_ratio_skips_dependent_copy(seed, n_samples):
+    """Test that a copy of a selected regressor is not selected again.
+
+    After the constant regressor is selected, the ERR of its copy must be
+    negligible. Reflecting the copy with Householder leaves a rounding noise
+    column whose ERR is arbitrary, so it could be selected as a new term.
+    """
+    rng = np.random.default_rng(seed)
+    psi = np.hstack([np.ones((n_samples, 2)), rng.normal(size=(n_samples, 10))])
+    y = np.zeros((n_samples + 2, 1))
+    y[2:] = 5 + psi[:, 2:6] @ rng.normal(size=(4, 1))
+    y[2:] += 0.01 * rng.normal(size=(n_samples, 1))
+    model = MockOFRBase()
+    model.alpha = 0
+
+    err, piv, _ = model.error_reduction_ratio(psi, y, psi.shape[1] - 1)
+
+    assert not {0, 1} <= set(piv.tolist())
+    assert err[-1] < 1e-10
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("n_samples", [500, 1000, 1024])
+def test_error_reduction_ratio_exhausted_candidate(n_samples, monkeypatch):
+    """Test that a copy deflated to a zero norm gets a zero ERR.
+
+    With 1024 samples the downdated norm of the copy of the constant regressor
+    is exactly zero, which must not be divided by nor trigger the Householder
+    fallback.
+    """
+    rng = np.random.default_rng(0)
+    psi = np.column_stack([np.ones(n_samples), np.ones(n_samples)])
+    psi = np.hstack([psi, rng.normal(size=(n_samples, 3))])
+    y = np.zeros((n_samples + 2, 1))
+    y[2:] = 5 + rng.normal(size=(n_samples, 1))
+    model = MockOFRBase()
+    model.alpha = 0
+    monkeypatch.setattr(model, "_ofr_householder", None)
+
+    err, piv, _ = model.error_reduction_ratio(psi, y, 4)
+
+    assert sorted(piv.tolist()) == [0, 2, 3, 4]
+    assert err[4] == 0
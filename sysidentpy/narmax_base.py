@@ -682,3 +682,24 @@ def rowhouse(RA: np.ndarray, v: np.ndarray) -> np.ndarray:
     RA = RA + v * w
     B = RA
     return B
+
+
+def rowhouse_inplace(RA: np.ndarray, v: np.ndarray) -> None:
+    """Perform a row Householder transformation in place.
+
+    Same as `rowhouse`, but the result is written back into `RA`, so the
+    caller does not have to copy it into the working matrix. The rank-one
+    update still builds a temporary of the same shape as `RA`.
+
+    Parameters
+    ----------
+    RA : array-like of shape = number_of_training_samples
+        The respective column of the matrix of regressors in each
+        iteration of ERR function.
+    v : array-like of shape = number_of_training_samples
+        The reflected vector obtained by using the householder reflection.
+
+    """
+    b = -2 / np.dot(v.T, v)
+    w = b * np.dot(RA.T, v)
+    RA += np.outer(v, w)
@@ -464,8 +464,8 @@ class SimulateNARMAX(BaseMSS):
         tmp_err = np.zeros(dimension)
         err = np.zeros(dimension)
 
-        for i in np.arange(0, dimension):
-            for j in np.arange(i, dimension):
+        for i in range(dimension):
+            for j in range(i, dimension):
                 # Add `eps` in the denominator to omit division by zero if
                 # denominator is zero
                 tmp_err[j] = (
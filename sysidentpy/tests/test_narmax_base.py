@@ -19,6 +19,7 @@ from sysidentpy.parameter_estimation.estimators import (
 from sysidentpy.narmax_base import (
     house,
     rowhouse,
+    rowhouse_inplace,
 )
 
 GR = RegressorDictionary()
@@ -235,6 +236,15 @@ def test_row_house():
     assert_almost_equal(rowhouse(a, b), output)
 
 
+def test_row_house_inplace():
+    rng = np.random.default_rng(0)
+    a = rng.random((10, 4))
+    v = house(rng.random(10))
+    expected = rowhouse(a, v)
+    rowhouse_inplace(a, v)
+    assert_almost_equal(a, expected)
+
+
 def test_get_max_lag():
     output1 = 1
     r = RegressorDictionary(